@@ -1,28 +1,25 @@
 import time
-import subprocess
 import sys
 import re
 import argparse
 import json
 import os
 import random
-import math
 import select
 import termios
 import tty
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Only the console is imported eagerly; the rest of rich is imported where it is
+# used so quick commands (help/add/done) start fast.
 from rich.console import Console
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-from rich.live import Live
-from rich.align import Align
-from rich.table import Table
-from rich.text import Text
-from rich.box import SIMPLE, ROUNDED, DOUBLE
-from rich.prompt import Prompt, IntPrompt, Confirm
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- CONSTANTS & PATHS ---
 APP_NAME = "HyprPomo"
@@ -33,8 +30,14 @@ CONFIG_DIR = Path.home() / ".config" / "hypr_pomo"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 DATA_DIR = Path.home() / ".local" / "share" / "hypr_pomo"
 DATA_FILE = DATA_DIR / "data.json"
+HISTORY_FILE = DATA_DIR / "history.jsonl"
 WAYBAR_FILE = Path("/tmp/hypr_pomo_status")
 
+# UI refresh interval (seconds)
+FRAME_INTERVAL = 0.25
+
+XP_PER_LEVEL = 500
+
 # Default Configuration (Used if config.json is missing)
 DEFAULT_CONFIG = {
     "times": {
@@ -104,17 +107,31 @@ class ConfigManager:
             return self.config.get(key, {}).get(subkey)
         return self.config.get(key)
 
-# Global Config Instance
-cfg = ConfigManager()
+# Global Config Instance (created on first use)
+_cfg = None
+
+def get_config():
+    global _cfg
+    if _cfg is None:
+        _cfg = ConfigManager()
+    return _cfg
 
 # --- UTILS ---
 
+_DURATION_RE = re.compile(r"^(\d+)([smh])$")
+
+def dump_json(data):
+    """Compact JSON bytes for data files (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
 def parse_duration(duration_str):
     if not duration_str: return 25 * 60
     if isinstance(duration_str, int): return duration_str * 60
     if duration_str.isdigit(): return int(duration_str) * 60
 
-    match = re.match(r"^(\d+)([smh])$", duration_str.lower())
+    match = _DURATION_RE.match(duration_str.lower())
     if match:
         v, u = match.groups()
         v = int(v)
@@ -123,35 +140,81 @@ def parse_duration(duration_str):
         if u == 'h': return v * 3600
     return None
 
+# PIDs of helper processes that have not been reaped yet
+_children = []
+
+def spawn_quiet(args):
+    """Starts a helper via posix_spawn (no fork of the interpreter), output discarded."""
+    for pid in _children[:]:
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0]: _children.remove(pid)
+        except ChildProcessError:
+            _children.remove(pid)
+
+    devnull = [
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ]
+    _children.append(os.posix_spawnp(args[0], args, os.environ, file_actions=devnull))
+
 def send_notification(title, message):
     try:
-        subprocess.run(["notify-send", "-a", APP_NAME, "-i", "alarm-clock", title, message])
+        spawn_quiet(["notify-send", "-a", APP_NAME, "-i", "alarm-clock", title, message])
     except:
         pass
 
 def play_sound(sound_key):
     """Plays sound if enabled and file exists."""
+    cfg = get_config()
     if not cfg.get("sounds", "enabled"): return
 
     path = cfg.get("sounds", sound_key)
     if path and os.path.exists(path):
         try:
-            subprocess.Popen(["paplay", path], stderr=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+            spawn_quiet(["paplay", path])
         except:
             pass
 
+def alert(title, message, sound_key):
+    """Fires the notification and sound for a phase change back-to-back."""
+    send_notification(title, message)
+    play_sound(sound_key)
+
+class WaybarWriter:
+    """Keeps the status file open and only rewrites it when the text changes."""
+    def __init__(self):
+        self.fd = None
+        self.last = None
+
+    def write(self, text):
+        if text == self.last: return
+        try:
+            if self.fd is None:
+                self.fd = os.open(WAYBAR_FILE, os.O_WRONLY | os.O_CREAT, 0o644)
+            buf = text.encode()
+            os.pwrite(self.fd, buf, 0)
+            os.ftruncate(self.fd, len(buf))
+            self.last = text
+        except:
+            self.close()
+
+    def close(self):
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except:
+                pass
+        self.fd = None
+        self.last = None
+
+waybar = WaybarWriter()
+
 def update_waybar(text):
-    try:
-        with open(WAYBAR_FILE, "w") as f:
-            f.write(text)
-    except:
-        pass
+    waybar.write(text)
 
 def get_level_info(xp):
-    level = math.floor(xp / 500) + 1
-    xp_for_next = level * 500
-    xp_in_level = xp - ((level - 1) * 500)
-    return level, xp_in_level, 500
+    levels_done, xp_in_level = divmod(int(xp), XP_PER_LEVEL)
+    return levels_done + 1, xp_in_level, XP_PER_LEVEL
 
 # --- INPUT HANDLING ---
 
@@ -169,14 +232,37 @@ class KeyReader:
         termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
 
     def get_key(self):
-        if select.select([sys.stdin], [], [], 0)[0]:
+        return self.wait_key(0)
+
+    def wait_key(self, timeout):
+        """Blocks until a key is pressed or timeout (seconds) expires."""
+        if select.select([sys.stdin], [], [], timeout)[0]:
             return sys.stdin.read(1)
         return None
 
 # --- DATA MANAGER ---
 
+def _check_marathon(b, ctx):
+    b["current"] = b.get("current", 0) + 1
+    return b["current"] >= b["target"]
+
+# Bounty id -> completion check, called with (bounty, session context)
+BOUNTY_CHECKS = {
+    "marathon": _check_marathon,
+    "deep_dive": lambda b, ctx: ctx["duration"] >= b["target"],
+    "early_bird": lambda b, ctx: ctx["hour"] < 9,
+    "night_owl": lambda b, ctx: ctx["hour"] >= 20,
+    "iron_will": lambda b, ctx: not ctx["paused"],
+}
+
 class DataManager:
     def __init__(self):
+        self._cache = None
+        self._stat = None  # (mtime_ns, size) of data.json at the last read/write
+        self._tasks_by_id = {}
+        self._pending = set()
+        self._in_transaction = False
+        self._dirty = False
         self.ensure_file()
         self.refresh_daily_bounties()
 
@@ -185,23 +271,92 @@ class DataManager:
         if not DATA_FILE.exists():
             default_data = {
                 "xp": 0,
-                "history": [],
                 "tasks": [],
                 "bounties": {"date": "", "list": []}
             }
             with open(DATA_FILE, "w") as f:
                 json.dump(default_data, f)
 
+    def file_stat(self):
+        try:
+            st = os.stat(DATA_FILE)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
     def load(self):
+        """Returns the in-memory data, re-reading data.json if another process changed it."""
+        if self._cache is None or (not self._dirty and self.file_stat() != self._stat):
+            self.read()
+        return self._cache
+
+    def read(self):
+        self._stat = self.file_stat()
         try:
             with open(DATA_FILE, "r") as f:
-                return json.load(f)
+                self._cache = json.load(f)
         except:
-            return {"xp": 0, "history": [], "tasks": [], "bounties": {"date": "", "list": []}}
+            self._cache = {"xp": 0, "tasks": [], "bounties": {"date": "", "list": []}}
+        if "history" in self._cache:
+            self.migrate_history(self._cache)
+        self.index_tasks(self._cache)
+
+    def index_tasks(self, data):
+        """Builds the id -> task map and the set of pending task ids."""
+        self._tasks_by_id = {t["id"]: t for t in data["tasks"]}
+        self._pending = {t["id"] for t in data["tasks"] if not t.get("completed")}
+
+    def migrate_history(self, data):
+        """Moves history from older data.json files into the append-only history.jsonl.
+
+        Safe to re-run: if a previous migration died before data.json was rewritten,
+        history.jsonl already starts with the legacy entries and they are not copied again.
+        """
+        legacy = data.pop("history")
+        existing = list(self.iter_history())
+        if existing[:len(legacy)] != legacy:
+            tmp = HISTORY_FILE.with_suffix(".jsonl.tmp")
+            with open(tmp, "w") as f:
+                for entry in legacy + existing:
+                    f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, HISTORY_FILE)
+        self.save(data)
 
     def save(self, data):
-        with open(DATA_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        """Writes to a temp file first so a crash never leaves data.json half-written."""
+        if self._in_transaction:
+            self._cache = data
+            self._dirty = True
+            return
+
+        tmp = DATA_FILE.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(dump_json(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, DATA_FILE)
+        self._cache = data
+        self._stat = self.file_stat()
+
+    @contextmanager
+    def transaction(self):
+        """Coalesces every save() made inside the block into a single write."""
+        self._in_transaction = True
+        self._dirty = False
+        try:
+            yield self
+        finally:
+            self._in_transaction = False
+            if self._dirty:
+                self._dirty = False
+                self.save(self._cache)
+
+    def get_xp(self):
+        # Render path: serve the cache without touching the disk
+        if self._cache is None: self.load()
+        return self._cache.get("xp", 0)
 
     def refresh_daily_bounties(self):
         data = self.load()
@@ -227,26 +382,18 @@ class DataManager:
         total_xp_gain = 0
         updates = False
 
-        duration = session_context.get("duration", 0)
-        paused = session_context.get("paused", False)
-        now = datetime.now()
+        ctx = {
+            "duration": session_context.get("duration", 0),
+            "paused": session_context.get("paused", False),
+            "hour": datetime.now().hour,
+        }
 
         for b in bounties:
             if b["completed"]: continue
-            completed = False
 
-            if b["id"] == "marathon":
-                b["current"] = b.get("current", 0) + 1
-                if b["current"] >= b["target"]: completed = True
-                updates = True
-            elif b["id"] == "deep_dive":
-                if duration >= b["target"]: completed = True
-            elif b["id"] == "early_bird":
-                if now.hour < 9: completed = True
-            elif b["id"] == "night_owl":
-                if now.hour >= 20: completed = True
-            elif b["id"] == "iron_will":
-                if not paused: completed = True
+            check = BOUNTY_CHECKS.get(b["id"])
+            completed = check(b, ctx) if check else False
+            if "current" in b: updates = True  # progress counters always change
 
             if completed:
                 b["completed"] = True
@@ -267,38 +414,44 @@ class DataManager:
         return int(amount), data["xp"]
 
     def add_history(self, task_name, duration):
-        data = self.load()
         entry = {
             "date": datetime.now().isoformat(),
             "task": task_name,
             "duration": duration
         }
-        data["history"].append(entry)
-        self.save(data)
+        with open(HISTORY_FILE, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def iter_history(self):
+        if not HISTORY_FILE.exists(): return
+        with open(HISTORY_FILE, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
 
     def add_task(self, task_name):
         data = self.load()
-        new_id = 1
-        if data["tasks"]:
-            new_id = max(t["id"] for t in data["tasks"]) + 1
-        data["tasks"].append({"id": new_id, "name": task_name, "completed": False})
+        new_id = max(self._tasks_by_id, default=0) + 1
+        task = {"id": new_id, "name": task_name, "completed": False}
+        data["tasks"].append(task)
+        self._tasks_by_id[new_id] = task
+        self._pending.add(new_id)
         self.save(data)
         console.print(f"[green]Task added:[/ green] {task_name}")
 
     def list_tasks(self):
-        data = self.load()
-        tasks = [t for t in data["tasks"] if not t.get("completed")]
-        return tasks
+        self.load()
+        return [self._tasks_by_id[i] for i in sorted(self._pending)]
 
     def complete_task(self, task_id):
         data = self.load()
-        found = False
-        for t in data["tasks"]:
-            if t["id"] == task_id:
-                t["completed"] = True
-                found = True
+        task = self._tasks_by_id.get(task_id)
+        if task is None:
+            return False
+        task["completed"] = True
+        self._pending.discard(task_id)
         self.save(data)
-        return found
+        return True
 
     def get_bounties(self):
         return self.load().get("bounties", {}).get("list", [])
@@ -306,7 +459,7 @@ class DataManager:
 # --- MAIN APP ---
 
 class PomoApp:
-    def __init__(self, work_sec, short_break_sec, long_break_sec, task_name="Focus", task_id=None):
+    def __init__(self, work_sec, short_break_sec, long_break_sec, task_name="Focus", task_id=None, db=None):
         self.work_seconds_config = work_sec
         self.short_break_config = short_break_sec
         self.long_break_config = long_break_sec
@@ -318,30 +471,72 @@ class PomoApp:
         self.total_work_seconds = 0
         self.total_break_seconds = 0
 
-        self.db = DataManager()
+        # Timing of the phase currently on screen (time.monotonic() based)
+        self._phase_started_at = None
+        self._paused_at = None
+        self._paused_seconds = 0
+
+        # Config is fixed for the run, resolve it once
+        cfg = get_config()
+        self.c_work = cfg.get("colors", "work")
+        self.c_break = cfg.get("colors", "break")
+        self.c_pause = cfg.get("colors", "pause")
+        self.c_dim = cfg.get("colors", "dim")
+        self.xp_per_minute = cfg.get("game_balance", "xp_per_minute")
+        self.overtime_multiplier = cfg.get("game_balance", "overtime_multiplier")
+        self.break_skip_xp_per_min = cfg.get("game_balance", "break_skip_xp_per_min")
+
+        self.db = db or DataManager()
         self.quote = random.choice(QUOTES)
 
+        # XP bar is built once and updated in place
+        from rich.progress import Progress, BarColumn, TextColumn
+        self._xp_progress = Progress(
+            TextColumn("[bold yellow]Lvl {task.fields[level]}"),
+            BarColumn(bar_width=None, complete_style="yellow", finished_style="yellow"),
+            TextColumn("[dim]{task.completed:.0f}/{task.total:.0f} XP"),
+            expand=True
+        )
+        self._xp_task = self._xp_progress.add_task("xp", total=1, level=1)
+
+        # Last rendered summary and the state it was built from
+        self._summary_key = None
+        self._summary_cache = None
+
+    def phase_elapsed(self):
+        """Unpaused seconds spent in the current phase."""
+        if self._phase_started_at is None: return 0
+        end = self._paused_at if self._paused_at is not None else time.monotonic()
+        return end - self._phase_started_at - self._paused_seconds
+
     def get_summary_table(self, current_mode, paused, overtime_secs=0):
+        work_secs = self.total_work_seconds
+        break_secs = self.total_break_seconds
+        if current_mode == "work": work_secs += self.phase_elapsed()
+        else: break_secs += self.phase_elapsed()
+
+        xp = self.db.get_xp()
+        key = (current_mode, paused, int(overtime_secs), xp, self.task_name,
+               int(work_secs), self.work_sessions,
+               int(break_secs), self.break_sessions)
+        if key == self._summary_key:
+            return self._summary_cache
+
+        from rich.align import Align
+        from rich.table import Table
+        from rich.text import Text
+
         table = Table.grid(expand=True, padding=(0, 1))
         def fmt(seconds): return str(timedelta(seconds=int(seconds)))
 
-        data = self.db.load()
-        lvl, curr_xp, req_xp = get_level_info(data.get("xp", 0))
+        lvl, curr_xp, req_xp = get_level_info(xp)
 
-        # Colors from Config
-        c_work = cfg.get("colors", "work")
-        c_break = cfg.get("colors", "break")
-        c_dim = cfg.get("colors", "dim")
+        c_work = self.c_work
+        c_break = self.c_break
 
         # XP Bar
-        xp_bar = Progress(
-            TextColumn(f"[bold yellow]Lvl {lvl}"),
-            BarColumn(bar_width=None, complete_style="yellow", finished_style="yellow"),
-            TextColumn(f"[dim]{curr_xp}/{req_xp} XP"),
-            expand=True
-        )
-        xp_bar.add_task("xp", total=req_xp, completed=curr_xp)
-        table.add_row(xp_bar)
+        self._xp_progress.update(self._xp_task, completed=curr_xp, total=req_xp, level=lvl)
+        table.add_row(self._xp_progress)
 
         table.add_row(Text("Task :", style="bold white"), Text(self.task_name, style=f"bold {c_work}"))
 
@@ -360,26 +555,36 @@ class PomoApp:
         table.add_row(Text("", style="dim"), Text("", style="dim"))
 
         w_style = f"bold {c_work}" if current_mode == "work" else "dim white"
-        table.add_row(Text("Work :", style=w_style), Text(f"{fmt(self.total_work_seconds)} ({self.work_sessions})", style=w_style))
+        table.add_row(Text("Work :", style=w_style), Text(f"{fmt(work_secs)} ({self.work_sessions})", style=w_style))
 
         b_style = f"bold {c_break}" if current_mode != "work" else "dim white"
-        table.add_row(Text("Break:", style=b_style), Text(f"{fmt(self.total_break_seconds)} ({self.break_sessions})", style=b_style))
+        table.add_row(Text("Break:", style=b_style), Text(f"{fmt(break_secs)} ({self.break_sessions})", style=b_style))
 
+        self._summary_key = key
+        self._summary_cache = table
         return table
 
     def run_timer(self, total_seconds, mode):
-        start_time = time.time()
-
-        c_work = cfg.get("colors", "work")
-        c_break = cfg.get("colors", "break")
-        c_pause = cfg.get("colors", "pause")
-        c_dim = cfg.get("colors", "dim")
+        from rich.align import Align
+        from rich.box import SIMPLE
+        from rich.console import Group
+        from rich.layout import Layout
+        from rich.live import Live
+        from rich.panel import Panel
+        from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+
+        self._phase_started_at = time.monotonic()
+        self._paused_at = None
+        self._paused_seconds = 0
+
+        c_work = self.c_work
+        c_break = self.c_break
+        c_pause = self.c_pause
+        c_dim = self.c_dim
 
         color = c_work if mode == "work" else c_break
         icon = "🍅" if mode == "work" else "☕"
 
-        play_sound(mode)
-
         progress = Progress(
             TextColumn(f"[{color}]{icon}"),
             BarColumn(bar_width=None, complete_style=color, finished_style="green"),
@@ -391,6 +596,32 @@ class PomoApp:
 
         task_id = progress.add_task("timer", total=total_seconds)
 
+        def centered(*panels):
+            """Stacks panels between flexible spacers; row heights are set by fit()."""
+            layout = Layout()
+            layout.split_column(Layout(Group(), ratio=1), *(Layout(p) for p in panels), Layout(Group(), ratio=1))
+            return layout
+
+        def fit(layout):
+            """Sizes each panel row to the height it renders at the current width."""
+            options = console.options.update(height=None)
+            for row in layout.children[1:-1]:
+                row.size = len(console.render_lines(row.renderable, options, pad=False))
+
+        # Views are built once; each frame only swaps panel contents
+        summary = Panel("", title="[bold white]Session Info", border_style=c_dim, box=SIMPLE, padding=(0, 1))
+        paused_summary = Panel("", border_style=c_pause)
+        flow_summary = Panel("", border_style=c_work)
+        flow_panel = Panel("", border_style=c_work)
+        views = {
+            "normal": centered(summary, Panel(progress, border_style=color, padding=(1, 2))),
+            "paused": centered(paused_summary, Panel(progress, border_style=c_pause)),
+            "flow": centered(flow_summary, flow_panel),
+        }
+        view = None
+        last_frame = None
+        last_fit = None
+
         paused = False
         skipped = False
         overtime_active = False
@@ -398,61 +629,65 @@ class PomoApp:
         current_overtime = 0
         remaining_at_skip = 0
 
-        with KeyReader() as keys:
-            with Live(console=console, refresh_per_second=4) as live:
-                while True:
-                    # INPUT
-                    key = keys.get_key()
-                    if key:
-                        k = key.lower()
-                        if k == 'q':
-                            update_waybar("")
-                            sys.exit(0)
-                        elif k == 's' and not overtime_active:
-                            skipped = True
-                            remaining_at_skip = max(0, total_seconds - (time.time() - start_time))
-                            break
-                        elif k == 'p' and not overtime_active:
-                            paused = not paused
-                            desc = f"[{c_pause if paused else color}]{'PAUSED' if paused else mode.upper()}"
-                            progress.update(task_id, description=desc)
-                        elif k == 'b' and overtime_active:
-                            break
-
-                    # LOGIC
-                    if paused:
-                        time.sleep(0.1)
-                        start_time += 0.1
-                        ui = Table.grid(expand=True)
-                        ui.add_row(Panel(self.get_summary_table(mode, True), border_style=c_pause))
-                        ui.add_row(Panel(progress, border_style=c_pause))
-                        live.update(Align.center(ui, vertical="middle"))
-                        continue
-
-                    elapsed = time.time() - start_time
-                    if mode == "work": self.total_work_seconds += 0.25
-                    else: self.total_break_seconds += 0.25
+        with KeyReader() as keys, Live(console=console, auto_refresh=False) as live:
+            next_tick = time.monotonic()
+            while True:
+                # INPUT (waits for a key or the next UI tick, whichever comes first).
+                # Once the paused screen is drawn nothing changes, so block until a key.
+                if paused and view == "paused":
+                    key = keys.wait_key(None)
+                else:
+                    key = keys.wait_key(max(0, next_tick - time.monotonic()))
+                now = time.monotonic()
+                if now >= next_tick:
+                    # Stay on the phase start + n * FRAME_INTERVAL grid, dropping missed frames
+                    next_tick += FRAME_INTERVAL * (int((now - next_tick) / FRAME_INTERVAL) + 1)
+                if key:
+                    k = key.lower()
+                    if k == 'q':
+                        update_waybar("")
+                        sys.exit(0)
+                    elif k == 's' and not overtime_active:
+                        skipped = True
+                        remaining_at_skip = max(0, total_seconds - self.phase_elapsed())
+                        break
+                    elif k == 'p' and not overtime_active:
+                        paused = not paused
+                        if paused:
+                            self._paused_at = time.monotonic()
+                        else:
+                            self._paused_seconds += time.monotonic() - self._paused_at
+                            self._paused_at = None
+                        desc = f"[{c_pause if paused else color}]{'PAUSED' if paused else mode.upper()}"
+                        progress.update(task_id, description=desc)
+                    elif k == 'b' and overtime_active:
+                        break
+
+                # LOGIC
+                if paused:
+                    paused_summary.renderable = self.get_summary_table(mode, True)
+                    frame = ("paused", paused_summary.renderable)
+                else:
+                    elapsed = self.phase_elapsed()
 
                     # OVERTIME LOGIC
                     if mode == "work" and elapsed >= total_seconds:
                         if not overtime_active:
                             overtime_active = True
-                            overtime_start = time.time()
+                            overtime_start = time.monotonic()
                             progress.update(task_id, total=None, completed=0, description=f"[bold {c_work}]🌊 FLOW")
 
-                        current_overtime = time.time() - overtime_start
+                        current_overtime = time.monotonic() - overtime_start
                         ot_str = str(timedelta(seconds=int(current_overtime)))[2:]
                         update_waybar(f"🌊 +{ot_str}")
 
-                        ui = Table.grid(expand=True)
-                        ui.add_row(Panel(self.get_summary_table(mode, False, current_overtime), border_style=c_work))
-                        ui.add_row(Panel(Align.center(f"[bold {c_work} size=20]+{ot_str}[/]\n[dim]Flow State active. Press 'b' to break.[/]"), border_style=c_work))
-                        live.update(Align.center(ui, vertical="middle"))
-                        time.sleep(0.1)
-                        continue
+                        flow_summary.renderable = self.get_summary_table(mode, False, current_overtime)
+                        frame = ("flow", ot_str, flow_summary.renderable)
+                        if frame != last_frame:
+                            flow_panel.renderable = Align.center(f"[bold {c_work} size=20]+{ot_str}[/]\n[dim]Flow State active. Press 'b' to break.[/]")
 
                     # NORMAL TIMER LOGIC
-                    if not overtime_active:
+                    else:
                         if elapsed >= total_seconds:
                             break
 
@@ -462,31 +697,45 @@ class PomoApp:
                         waybar_icon = "🍅" if mode == "work" else "☕"
                         update_waybar(f"{waybar_icon} {rem_str}")
 
-                        summary = Panel(self.get_summary_table(mode, False), title="[bold white]Session Info", border_style=c_dim, box=SIMPLE, padding=(0, 1))
-                        timer_panel = Panel(progress, border_style=color, padding=(1, 2))
-
-                        ui = Table.grid(expand=True)
-                        ui.add_row(summary)
-                        ui.add_row(timer_panel)
-                        live.update(Align.center(ui, vertical="middle"))
-
-                    time.sleep(0.1)
+                        summary.renderable = self.get_summary_table(mode, False)
+                        frame = ("normal", rem_str, int(elapsed * 100 / total_seconds), summary.renderable)
+
+                # RENDER (only when something visible changed)
+                if frame == last_frame:
+                    continue
+                last_frame = frame
+                if view != frame[0]:
+                    view = frame[0]
+                    live.update(views[view])
+                # Re-measure rows only when the summary table, view or terminal size changes
+                fit_key = (view, frame[-1], console.size)
+                if fit_key != last_fit:
+                    last_fit = fit_key
+                    fit(views[view])
+                live.refresh()
+
+        # Fold the finished phase into the running totals
+        if mode == "work": self.total_work_seconds += self.phase_elapsed()
+        else: self.total_break_seconds += self.phase_elapsed()
+        self._phase_started_at = None
 
         return skipped, current_overtime, remaining_at_skip
 
     def start(self):
+        from rich.prompt import Confirm
+
         console.clear()
         update_waybar("")
 
         try:
             while True:
                 # --- WORK PHASE ---
-                send_notification("Focus", f"Time to work on: {self.task_name}")
+                alert("Focus", f"Time to work on: {self.task_name}", "work")
                 skipped, overtime, _ = self.run_timer(self.work_seconds_config, "work")
 
                 if not skipped:
-                    xp_rate = cfg.get("game_balance", "xp_per_minute")
-                    ot_mult = cfg.get("game_balance", "overtime_multiplier")
+                    xp_rate = self.xp_per_minute
+                    ot_mult = self.overtime_multiplier
 
                     base_mins = self.work_seconds_config / 60
                     ot_mins = overtime / 60
@@ -494,12 +743,13 @@ class PomoApp:
                     xp_base = base_mins * xp_rate
                     xp_ot = ot_mins * xp_rate * ot_mult
 
-                    total_xp, _ = self.db.add_xp(xp_base + xp_ot)
-                    self.db.add_history(self.task_name, self.work_seconds_config + overtime)
-                    self.work_sessions += 1
+                    with self.db.transaction():
+                        total_xp, _ = self.db.add_xp(xp_base + xp_ot)
+                        self.db.add_history(self.task_name, self.work_seconds_config + overtime)
+                        self.work_sessions += 1
 
-                    context = {"duration": self.work_seconds_config + overtime, "paused": False}
-                    bounty_xp = self.db.check_bounties(context)
+                        context = {"duration": self.work_seconds_config + overtime, "paused": False}
+                        bounty_xp = self.db.check_bounties(context)
 
                     msg = f"[bold green]Session Complete![/]\nBase: {int(xp_base)} XP"
                     if xp_ot > 0: msg += f" | Flow Bonus: [cyan]+{int(xp_ot)} XP[/]"
@@ -523,12 +773,12 @@ class PomoApp:
                 total_break = base_break + overtime
                 label = "long_break" if is_long else "short_break"
 
-                send_notification("Break", f"Time to relax. ({int(total_break/60)}m)")
+                alert("Break", f"Time to relax. ({int(total_break/60)}m)", "break")
 
                 skipped_break, _, rem_break = self.run_timer(total_break, label)
 
                 if skipped_break and rem_break > 60:
-                    skip_rate = cfg.get("game_balance", "break_skip_xp_per_min")
+                    skip_rate = self.break_skip_xp_per_min
                     mins_saved = rem_break / 60
                     xp_gain = int(mins_saved * skip_rate)
                     self.db.add_xp(xp_gain)
@@ -544,6 +794,9 @@ class PomoApp:
 # --- COMMANDS ---
 
 def cmd_help():
+    from rich.box import ROUNDED
+    from rich.table import Table
+
     table = Table(title=f"🍅 {APP_NAME} Help", box=ROUNDED, border_style="cyan")
     table.add_column("Command / Key", style="yellow")
     table.add_column("Description", style="white")
@@ -561,9 +814,13 @@ def cmd_help():
     table.add_row("q", "Quit application")
 
     console.print(table)
-    console.print(f"\n[dim]Config file located at: {CONFIG_FILE}[/]")
+    console.print(f"\n[dim]Config file: {CONFIG_FILE} (created with defaults on first timer run)[/]")
 
 def cmd_list(db):
+    from rich.box import SIMPLE, ROUNDED
+    from rich.panel import Panel
+    from rich.table import Table
+
     data = db.load()
     lvl, curr, req = get_level_info(data.get("xp", 0))
     bounties = db.get_bounties()
@@ -604,16 +861,17 @@ def cmd_done(db, task_id_str):
 # --- ENTRY POINT ---
 
 if __name__ == "__main__":
+    # Help needs neither the data file nor the config, so handle it first
+    if len(sys.argv) > 1 and sys.argv[1].lower() == "help":
+        cmd_help()
+        sys.exit(0)
+
     db = DataManager()
 
     if len(sys.argv) > 1:
         cmd = sys.argv[1].lower()
         args = sys.argv[2:]
 
-        if cmd == "help":
-            cmd_help()
-            sys.exit(0)
-
         if cmd == "add":
             if not args: console.print("[red]Usage: timer add \"Task Name\"[/]")
             else: cmd_add(db, " ".join(args))
@@ -640,6 +898,7 @@ if __name__ == "__main__":
             console.print(f" [cyan]{t['id']}[/]: {t['name']}")
         console.print(" [dim]0: Custom / General[/]")
 
+        from rich.prompt import IntPrompt
         choice = IntPrompt.ask("Enter ID", default=0)
         if choice != 0:
             found = next((t for t in tasks if t['id'] == choice), None)
@@ -660,6 +919,7 @@ if __name__ == "__main__":
         selected_task_id = None
 
     # Load defaults from Config if not provided
+    cfg = get_config()
     def_work = parse_duration(cfg.get("times", "work"))
     def_short = parse_duration(cfg.get("times", "short_break"))
     def_long = parse_duration(cfg.get("times", "long_break"))
@@ -668,5 +928,5 @@ if __name__ == "__main__":
     s_sec = times[1] if len(times) >= 2 else def_short
     l_sec = times[2] if len(times) >= 3 else def_long
 
-    app = PomoApp(w_sec, s_sec, l_sec, selected_task_name, selected_task_id)
+    app = PomoApp(w_sec, s_sec, l_sec, selected_task_name, selected_task_id, db=db)
     app.start()